@@ -7,10 +7,13 @@
 #
 
 import requests
-import random
 import argparse
-from subprocess import PIPE, Popen
+from subprocess import PIPE, Popen, TimeoutExpired
 from contextlib import contextmanager
+from typing import IO, List
+import io
+import threading
+import queue
 import re
 import signal
 import os
@@ -18,6 +21,9 @@ import time
 import sys
 
 _is_win = os.name == 'nt'
+_server_start_re = re.compile(r'Server listening at 0\.0\.0\.0:([0-9]+)')
+_startup_timeout = 60.0 # seconds
+_shutdown_timeout = 10.0 # seconds
 
 
 def _check_response(res: requests.Response):
@@ -27,12 +33,46 @@ def _check_response(res: requests.Response):
 
 
 def _random_string() -> str:
-    return bytes(random.getrandbits(8) for _ in range(8)).hex()
+    return os.urandom(8).hex()
+
+
+# Reads the server's stdout from a background thread, accumulating lines as they arrive.
+# This prevents the server from blocking on a full pipe while we're running the tests
+class _ServerOutput:
+    def __init__(self, stream: IO[str]) -> None:
+        self._lines = queue.Queue() # type: queue.Queue[str]
+        self._thread = threading.Thread(target=self._drain, args=(stream,), daemon=True)
+        self._thread.start()
+
+    def _drain(self, stream: IO[str]) -> None:
+        for line in stream:
+            self._lines.put(line)
+        self._lines.put('') # EOF, as readline() would return
+
+    # Waits (at most timeout seconds) for the next output line. Returns an empty string on EOF
+    def readline(self, timeout: float) -> str:
+        try:
+            return self._lines.get(timeout=timeout)
+        except queue.Empty:
+            raise RuntimeError('Timed out waiting for server output') from None
+
+    # Whether the reader thread is still waiting for EOF
+    def is_reading(self) -> bool:
+        return self._thread.is_alive()
+
+    # Waits (at most timeout seconds) for the process to close its stdout
+    # and returns all lines not consumed yet
+    def read_remaining(self, timeout: float) -> str:
+        self._thread.join(timeout)
+        res = [] # type: List[str]
+        while not self._lines.empty():
+            res.append(self._lines.get_nowait())
+        return ''.join(res)
 
 
 # Returns the port the server is listening at
 def _parse_server_start_line(line: str) -> int:
-    m = re.match(r'Server listening at 0\.0\.0\.0:([0-9]+)', line)
+    m = _server_start_re.match(line)
     if m is None:
         raise RuntimeError('Unexpected server start line')
     return int(m.group(1))
@@ -45,9 +85,11 @@ def _launch_server(exe: str, host: str):
     server = Popen([exe, 'example_user', 'example_password', host, '0'], stdout=PIPE)
     assert server.stdout is not None
     with server:
+        # Popen's encoding argument requires Python 3.6, so decode the output ourselves
+        output = _ServerOutput(io.TextIOWrapper(server.stdout, encoding='utf-8', errors='replace'))
         try:
             # Wait until the server is ready
-            ready_line = server.stdout.readline().decode()
+            ready_line = output.readline(_startup_timeout)
             print(ready_line, end='', flush=True)
             if ready_line.startswith('Sorry'): # C++14 unsupported, skip the test
                 exit(0)
@@ -66,22 +108,37 @@ def _launch_server(exe: str, host: str):
                 # Send SIGTERM
                 server.terminate()
 
-            # Print any output the process generated
-            print('Server stdout: \n', server.stdout.read().decode(), flush=True)
+            # Don't wait forever if the server doesn't react to the signal
+            try:
+                server.wait(timeout=_shutdown_timeout)
+            except TimeoutExpired:
+                print('Server did not exit in time, killing it', flush=True)
+                server.kill()
+                server.wait()
+
+            # Print any output the process generated. Any child process that inherited
+            # the pipe may keep it open, so don't wait for EOF indefinitely
+            print('Server stdout: \n', output.read_remaining(_shutdown_timeout), flush=True)
+
+            # If the pipe is still open, the reader thread is blocked on it, and closing the stream
+            # would wait for the thread to finish. Detach the stream so Popen doesn't close it,
+            # and let the (daemon) reader thread go away with the process
+            if output.is_reading():
+                server.stdout = None
     
     # Verify that it exited gracefully
     if (_is_win and server.returncode != 9999) or (not _is_win and server.returncode):
         raise RuntimeError('Server did not exit cleanly. retcode={}'.format(server.returncode))
 
 
-def _call_endpoints(port: int):
+def _call_endpoints(session: requests.Session, port: int):
     base_url = 'http://127.0.0.1:{}'.format(port)
 
     # Create a note
     note_unique = _random_string()
     title = 'My note {}'.format(note_unique)
     content = 'This is a note about {}'.format(note_unique)
-    res = requests.post(
+    res = session.post(
         '{}/notes'.format(base_url),
         json={'title': title, 'content': content}
     )
@@ -92,7 +149,7 @@ def _call_endpoints(port: int):
     assert note['note']['content'] == content
 
     # Retrieve all notes
-    res = requests.get('{}/notes'.format(base_url))
+    res = session.get('{}/notes'.format(base_url))
     _check_response(res)
     all_notes = res.json()
     assert len([n for n in all_notes['notes'] if n['id'] == note_id]) == 1
@@ -101,7 +158,7 @@ def _call_endpoints(port: int):
     note_unique = _random_string()
     title = 'Edited {}'.format(note_unique)
     content = 'This is a note an edit on {}'.format(note_unique)
-    res = requests.put(
+    res = session.put(
         '{}/notes/{}'.format(base_url, note_id),
         json={'title': title, 'content': content}
     )
@@ -112,7 +169,7 @@ def _call_endpoints(port: int):
     assert note['note']['content'] == content
 
     # Retrieve the note
-    res = requests.get('{}/notes/{}'.format(base_url, note_id))
+    res = session.get('{}/notes/{}'.format(base_url, note_id))
     _check_response(res)
     note = res.json()
     assert int(note['note']['id']) == note_id
@@ -120,12 +177,12 @@ def _call_endpoints(port: int):
     assert note['note']['content'] == content
 
     # Delete the note
-    res = requests.delete('{}/notes/{}'.format(base_url, note_id))
+    res = session.delete('{}/notes/{}'.format(base_url, note_id))
     _check_response(res)
     assert res.json()['deleted'] == True
 
     # The note is not there
-    res = requests.get('{}/notes/{}'.format(base_url, note_id))
+    res = session.get('{}/notes/{}'.format(base_url, note_id))
     assert res.status_code == 404
 
 
@@ -139,8 +196,9 @@ def main():
 
     # Launch the server
     with _launch_server(args.executable, args.host) as listening_port:
-    # Run the tests
-        _call_endpoints(listening_port)
+        # Run the tests. A single session keeps the connection alive between requests
+        with requests.Session() as session:
+            _call_endpoints(session, listening_port)
 
 
 if __name__ == '__main__':
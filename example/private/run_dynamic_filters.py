@@ -6,7 +6,8 @@
 # file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
 #
 
-from subprocess import run
+from subprocess import run, PIPE, STDOUT
+from concurrent.futures import ThreadPoolExecutor
 import argparse
 from typing import List
 
@@ -19,8 +20,11 @@ class _Runner:
     
     def run(self, opts: List[str]) -> None:
         cmdline = [self._exe, 'example_user', 'example_password', self._host] + opts
-        print(' + ', ' '.join(cmdline))
-        run(cmdline, check=True)
+        res = run(cmdline, stdout=PIPE, stderr=STDOUT)
+
+        # Print the command and its output at once, so concurrent runs don't interleave
+        print(' + {}\n{}'.format(' '.join(cmdline), res.stdout.decode()), end='', flush=True)
+        res.check_returncode()
 
 
 def main():
@@ -33,11 +37,17 @@ def main():
     # Build a runner
     runner = _Runner(args.executable, args.host)
 
-    # Run the example with several combinations
-    runner.run(['--company-id=HGS'])
-    runner.run(['--company-id=AWC', '--last-name=Alice'])
-    runner.run(['--min-salary=25000', '--first-name=Bob', '--order-by=salary'])
-    runner.run(['--company-id=AWC', '--first-name=Underpaid', '--last-name=Intern', '--min-salary=1', '--order-by=salary'])
+    # Run the example with several combinations.
+    # These only read from the database, so they can run concurrently
+    combinations = [
+        ['--company-id=HGS'],
+        ['--company-id=AWC', '--last-name=Alice'],
+        ['--min-salary=25000', '--first-name=Bob', '--order-by=salary'],
+        ['--company-id=AWC', '--first-name=Underpaid', '--last-name=Intern', '--min-salary=1', '--order-by=salary'],
+    ]
+    with ThreadPoolExecutor(max_workers=len(combinations)) as executor:
+        # Consuming the results propagates any failure
+        list(executor.map(runner.run, combinations))
 
 if __name__ == '__main__':
     main()
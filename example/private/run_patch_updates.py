@@ -6,7 +6,8 @@
 # file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
 #
 
-from subprocess import run
+from subprocess import run, PIPE, STDOUT
+from concurrent.futures import ThreadPoolExecutor
 import argparse
 from typing import List
 
@@ -20,8 +21,11 @@ class _Runner:
     def run(self, updates: List[str]) -> None:
         employee_id = '1' # Guaranteed to exist
         cmdline = [self._exe, 'example_user', 'example_password', self._host, employee_id] + updates
-        print(' + ', ' '.join(cmdline))
-        run(cmdline, check=True)
+        res = run(cmdline, stdout=PIPE, stderr=STDOUT)
+
+        # Print the command and its output at once, so concurrent runs don't interleave
+        print(' + {}\n{}'.format(' '.join(cmdline), res.stdout.decode()), end='', flush=True)
+        res.check_returncode()
 
 
 def main():
@@ -34,10 +38,17 @@ def main():
     # Build a runner
     runner = _Runner(args.executable, args.host)
 
-    # Run the example with several combinations
-    runner.run(['--salary=40000'])
-    runner.run(['--company-id=HGS', '--last-name=Alice'])
-    runner.run(['--salary=25000', '--company-id=AWC', '--first-name=John', '--last-name=Doe'])
+    # Run the example with several combinations.
+    # Each run updates the employee within its own transaction,
+    # so they can run concurrently
+    combinations = [
+        ['--salary=40000'],
+        ['--company-id=HGS', '--last-name=Alice'],
+        ['--salary=25000', '--company-id=AWC', '--first-name=John', '--last-name=Doe'],
+    ]
+    with ThreadPoolExecutor(max_workers=len(combinations)) as executor:
+        # Consuming the results propagates any failure
+        list(executor.map(runner.run, combinations))
 
 
 if __name__ == '__main__':
@@ -9,7 +9,7 @@
 from pathlib import Path
 import os
 from typing import List, Optional
-from .common import run, IS_WINDOWS
+from .common import run, IS_WINDOWS, num_jobs
 from .db_setup import db_setup
 from .install_boost import install_boost
 
@@ -86,7 +86,7 @@ def b2_build(
         _conditional('architecture=x86', address_model == '32' and not IS_WINDOWS),
         'warnings=extra',
         'warnings-as-errors=on',
-        '-j4',
+        '-j{}'.format(num_jobs()),
         'libs/mysql/test',
         'libs/mysql/test/integration//boost_mysql_integrationtests',
         'libs/mysql/test/thread_safety',
@@ -9,7 +9,7 @@
 from pathlib import Path
 import os
 from typing import Optional, Dict
-from .common import run, BOOST_ROOT, IS_WINDOWS, mkdir_and_cd
+from .common import run, BOOST_ROOT, IS_WINDOWS, mkdir_and_cd, num_jobs
 from .db_setup import db_setup
 from .install_boost import install_boost
 
@@ -27,7 +27,7 @@ class _CMakeRunner:
     def __init__(self, generator: str, build_type: str) -> None:
         self._generator = generator
         self._build_type = build_type
-        os.environ['CMAKE_BUILD_PARALLEL_LEVEL'] = '4'
+        os.environ['CMAKE_BUILD_PARALLEL_LEVEL'] = str(num_jobs())
 
 
     def configure(self, source_dir: Path, binary_dir: Path, variables: Dict[str, str]) -> None:
@@ -75,6 +75,8 @@ def cmake_build(
     # Config
     cmake_distro = Path(os.path.expanduser('~')).joinpath('cmake-distro')
     test_folder = BOOST_ROOT.joinpath('libs', 'mysql', 'test', 'cmake_test')
+    prefix_path = _cmake_prefix_path()
+    shared_libs = _cmake_bool(build_shared_libs)
     runner = _CMakeRunner(generator=generator, build_type=build_type)
 
     # Get Boost
@@ -92,9 +94,9 @@ def cmake_build(
         source_dir=BOOST_ROOT,
         binary_dir=bin_dir,
         variables={
-            'CMAKE_PREFIX_PATH': _cmake_prefix_path(),
+            'CMAKE_PREFIX_PATH': prefix_path,
             'BOOST_INCLUDE_LIBRARIES': 'mysql',
-            'BUILD_SHARED_LIBS': _cmake_bool(build_shared_libs),
+            'BUILD_SHARED_LIBS': shared_libs,
             'CMAKE_INSTALL_PREFIX': str(cmake_distro),
             'BUILD_TESTING': 'ON',
             'CMAKE_INSTALL_MESSAGE': 'NEVER',
@@ -111,9 +113,9 @@ def cmake_build(
         source_dir=test_folder,
         binary_dir=test_folder.joinpath('__build_add_subdirectory'),
         variables={
-            'CMAKE_PREFIX_PATH': _cmake_prefix_path(),
+            'CMAKE_PREFIX_PATH': prefix_path,
             'BOOST_CI_INSTALL_TEST': 'OFF',
-            'BUILD_SHARED_LIBS': _cmake_bool(build_shared_libs)
+            'BUILD_SHARED_LIBS': shared_libs
         }
     )
     runner.build_all()
@@ -128,7 +130,7 @@ def cmake_build(
             binary_dir=test_folder.joinpath('__build_find_package'),
             variables={
                 'BOOST_CI_INSTALL_TEST': 'ON',
-                'BUILD_SHARED_LIBS': _cmake_bool(build_shared_libs),
+                'BUILD_SHARED_LIBS': shared_libs,
                 'CMAKE_PREFIX_PATH': _cmake_prefix_path(cmake_distro)
             }
         )
@@ -21,6 +21,26 @@ def run(args: List[str]) -> None:
     subprocess.run(args, check=True)
 
 
+# Number of parallel build jobs. Can be overridden using the BOOST_MYSQL_JOBS
+# environment variable, for CI agents running several builds at once
+def num_jobs() -> int:
+    env_value = os.environ.get('BOOST_MYSQL_JOBS')
+    if env_value is not None:
+        try:
+            res = int(env_value)
+        except ValueError:
+            res = 0
+        if res <= 0:
+            raise RuntimeError('BOOST_MYSQL_JOBS should be a positive integer, got {!r}'.format(env_value))
+        return res
+
+    # sched_getaffinity only reports the CPUs this process may run on
+    # (e.g. the ones assigned to a container), but isn't available everywhere
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 4
+
+
 def mkdir_and_cd(path: Path) -> None:
     os.makedirs(str(path), exist_ok=True)
     os.chdir(str(path))
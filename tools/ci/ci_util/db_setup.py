@@ -9,15 +9,32 @@
 from typing import List
 from pathlib import Path
 import subprocess
+import tempfile
 import os
+from concurrent.futures import ThreadPoolExecutor
 from .common import IS_WINDOWS
 
 
 def _run_piped_stdin(args: List[str], fname: Path) -> None:
-    with open(str(fname), 'rt', encoding='utf8') as f:
-        content = f.read()
-    print('+ ', args, '(with < {})'.format(fname), flush=True)
-    subprocess.run(args, input=content.encode(), check=True)
+    # Several of these may run concurrently. Capture the process output in a file
+    # (a pipe could fill up while we're still writing stdin) and print it in one block
+    with open(str(fname), 'rt', encoding='utf8') as f, tempfile.TemporaryFile() as output:
+        # Stream the file in chunks rather than loading it in memory.
+        # Reading in text mode normalizes line endings, which may be CRLF on Windows checkouts
+        with subprocess.Popen(args, stdin=subprocess.PIPE, stdout=output, stderr=subprocess.STDOUT) as proc:
+            assert proc.stdin is not None
+            try:
+                for chunk in iter(lambda: f.read(64 * 1024), ''):
+                    proc.stdin.write(chunk.encode())
+                proc.stdin.close()
+            except BrokenPipeError:
+                pass # The process exited early. Its exit code will tell what happened
+        output.seek(0)
+        print('+  {} (with < {})\n{}'.format(args, fname, output.read().decode(errors='replace')), end='', flush=True)
+
+    # All scripts share the same command line, so report which file failed
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, '{} < {}'.format(' '.join(args), fname))
 
 
 def _run_sql_file(fname: Path) -> None:
@@ -29,10 +46,17 @@ def db_setup(
     db: str,
     server_host: str,
 ) -> None:
-    # Source files
-    _run_sql_file(source_dir.joinpath('example', 'db_setup.sql'))
-    _run_sql_file(source_dir.joinpath('example', 'order_management', 'db_setup.sql'))
-    _run_sql_file(source_dir.joinpath('test', 'integration', 'db_setup.sql'))
+    # Source files. These create independent databases and users, so they can run concurrently
+    sql_files = [
+        source_dir.joinpath('example', 'db_setup.sql'),
+        source_dir.joinpath('example', 'order_management', 'db_setup.sql'),
+        source_dir.joinpath('test', 'integration', 'db_setup.sql'),
+    ]
+    with ThreadPoolExecutor(max_workers=len(sql_files)) as executor:
+        # Consuming the results propagates any failure
+        list(executor.map(_run_sql_file, sql_files))
+
+    # This one grants privileges on the integration tests database, so it must run afterwards
     if db == 'mysql8':
         _run_sql_file(source_dir.joinpath('test', 'integration', 'db_setup_sha256.sql'))
     
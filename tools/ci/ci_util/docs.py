@@ -9,7 +9,7 @@
 from pathlib import Path
 import os
 from shutil import copytree, rmtree
-from .common import BOOST_ROOT, run
+from .common import BOOST_ROOT, run, num_jobs
 from .install_boost import install_boost
 
 
@@ -30,7 +30,7 @@ def docs_build(
         f.writelines(['using doxygen ;\n', 'using boostbook ;\n', 'using saxonhe ;\n'])
 
     # Run b2
-    run(['b2', '-j4', 'cxxstd=17', 'libs/mysql/doc//boostrelease'])
+    run(['b2', '-j{}'.format(num_jobs()), 'cxxstd=17', 'libs/mysql/doc//boostrelease'])
 
     # Copy the resulting docs into a well-known path
     output_dir = source_dir.joinpath('doc', 'html')
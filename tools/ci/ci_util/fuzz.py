@@ -9,7 +9,7 @@
 from pathlib import Path
 import os
 from shutil import unpack_archive, make_archive
-from .common import run
+from .common import run, num_jobs
 from .seed_corpus import generate_seed_corpus
 from .db_setup import db_setup
 from .install_boost import install_boost
@@ -52,7 +52,7 @@ def fuzz_build(
         'toolset=clang',
         'cxxstd=20',
         'warnings-as-errors=on',
-        '-j4',
+        '-j{}'.format(num_jobs()),
         'libs/mysql/test/fuzzing',
     ])
 
@@ -6,17 +6,22 @@
 # file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
 #
 
-from shutil import rmtree, ignore_patterns, copytree
+from shutil import rmtree, copytree
 import stat
 import sys
 from pathlib import Path
 import os
+from typing import List
 from .common import run, IS_WINDOWS, BOOST_ROOT
 
 def _remove_readonly(func, path, _):
     os.chmod(path, stat.S_IWRITE)
     func(path)
 
+# copytree ignore callback. Skips git metadata and build directories (__build*__)
+def _ignore_build_files(_: str, names: List[str]) -> List[str]:
+    return [name for name in names if name == '.git' or (name.startswith('__build') and name.endswith('__'))]
+
 def _copy_lib_to_boost(source_dir: Path):
     # Config
     supports_dir_exist_ok = sys.version_info.minor >= 8
@@ -31,7 +36,7 @@ def _copy_lib_to_boost(source_dir: Path):
     copytree(
         str(source_dir),
         str(lib_dir),
-        ignore=ignore_patterns('__build*__', '.git'),
+        ignore=_ignore_build_files,
         **({ 'dirs_exist_ok': True } if supports_dir_exist_ok else {}) # type: ignore
     )
 